@@ -15,44 +15,140 @@ Arguments:
 """
 
 import argparse
+import multiprocessing
+import os
 import pathlib
+from collections.abc import Iterator
+from threadpoolctl import threadpool_limits
 from spectrogram import Spectrogram
 
+AUDIO_SUFFIXES = {".m4a", ".mp3", ".flac", ".wav"}
+GPU_WORKERS = 2
+
+_spectrogram: Spectrogram
+
+
+def find_audio_files(directory: str) -> Iterator[pathlib.Path]:
+    """
+    Recursively find the audio files in a directory.
+
+    The directory tree is walked with `os.scandir`, whose entries cache the file
+    type read with the directory listing, so most files are filtered by type and
+    suffix without an extra `stat` call. Symbolic links to directories are not
+    followed, and directories that cannot be read are skipped.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to search.
+
+    Yields
+    ------
+    pathlib.Path
+        The path to each file with a suffix in `AUDIO_SUFFIXES`.
+    """
+    try:
+        entries = os.scandir(directory)
+    except PermissionError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_audio_files(entry.path)
+            elif (
+                os.path.splitext(entry.name)[1].lower() in AUDIO_SUFFIXES
+                and entry.is_file()
+            ):
+                yield pathlib.Path(entry.path)
+
+
+def init_worker(use_gpu: bool) -> None:
+    """
+    Prepare a worker process for creating spectrograms.
+
+    This function limits BLAS/OpenMP to a single thread, to avoid oversubscribing
+    the CPU when all workers are busy, and creates the `Spectrogram` reused by the
+    worker for each of its files, so its figure is only built once per process.
+
+    Parameters
+    ----------
+    use_gpu : bool
+        Whether to compute the FFTs on a CUDA GPU.
+    """
+    global _spectrogram  # pylint: disable=global-statement
+    threadpool_limits(limits=1)
+    _spectrogram = Spectrogram(use_gpu=use_gpu)
+
+
+def process_one(path: pathlib.Path) -> pathlib.Path:
+    """
+    Create and save the spectrogram image of a single audio file.
+
+    This function is run in a worker process set up by `init_worker`.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the audio file.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the saved spectrogram image.
+    """
+    _spectrogram.create(path)
+    return _spectrogram.save_png()
+
 
 def main() -> None:
     """
     Main function to create and save a spectrogram image from an audio file.
 
-    This function initializes a Spectrogram object, loads an audio file,
-    generates its spectrogram, and saves it as a PNG image.
+    This function collects the audio files from the given path and creates
+    their spectrograms in parallel, using one worker process per CPU core, or
+    `GPU_WORKERS` processes sharing the GPU when it is used, so the device does
+    not hold one CUDA context per core. No more workers are started than there
+    are files, as each of them loads the libraries and builds its own figure.
     """
 
     parser = argparse.ArgumentParser(description="Batch spectrogram creator")
     parser.add_argument("path", type=str, help="Path to the file or directory")
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Compute the FFTs on a CUDA GPU (requires PyTorch)",
+    )
     args = parser.parse_args()
+    if args.gpu and not Spectrogram.is_gpu_available():
+        parser.error("--gpu requires PyTorch with CUDA support")
 
     print(f"Received path: {args.path}")
 
-    spectrogram = Spectrogram()
     path = pathlib.Path(args.path).resolve()
 
     file_list = []
     if path.is_file():
         file_list.append(path)
     elif path.is_dir():
-        file_list = [
-            p
-            for p in path.rglob("*")
-            if p.is_file() and p.suffix.lower() in (".m4a", ".mp3", ".flac", ".wav")
-        ]
+        file_list = list(find_audio_files(str(path)))
 
     print(f"Found {len(file_list)} files")
+    if not file_list:
+        return
 
-    for i, file in enumerate(file_list):
-        print(f"Processing file ({i+1}/{len(file_list)}): {file}")
-        spectrogram.create(file)
-        spectrogram.save_png()
+    # CUDA cannot be used in a process forked after it was initialized.
+    context = multiprocessing.get_context("spawn" if args.gpu else None)
+    processes = GPU_WORKERS if args.gpu else os.cpu_count() or 1
+    processes = min(processes, os.cpu_count() or 1, len(file_list))
+    with context.Pool(
+        processes=processes, initializer=init_worker, initargs=(args.gpu,)
+    ) as pool:
+        for i, output in enumerate(
+            pool.imap_unordered(process_one, file_list, chunksize=4)
+        ):
+            print(f"Processed file ({i+1}/{len(file_list)}): {output}")
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -2,8 +2,11 @@
 Metadata parsing module for audio files.
 
 This module provides a class, `MetadataParser`,
-for parsing metadata from audio files using FFmpeg's ffprobe command.
+for parsing metadata from audio files using `mutagen` or FFmpeg's ffprobe command.
 It can extract metadata such as codec, sample rate, bitrate, duration, and channel layout.
+Common formats are read from the file headers with `mutagen`, without starting a process;
+ffprobe is only used for the other files.
+The metadata is cached per file, and can be fetched in the background ahead of use.
 
 Classes:
     MetadataParser: A class for parsing metadata from audio files.
@@ -18,11 +21,110 @@ Variables:
     None
 
 Notes:
-    This module requires FFmpeg to be installed and available in the system's PATH.
+    This module requires FFmpeg to be installed and available in the system's PATH,
+    for the formats which are not read with `mutagen`.
 """
 
+import functools
 import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+import mutagen
 from ffmpeg import FFmpeg
+from mutagen.flac import FLAC
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
+from mutagen.wave import WAVE
+
+_CHANNEL_LAYOUTS = {1: "mono", 2: "stereo"}
+_MP4_CODECS = {
+    "mp4a": "AAC (Advanced Audio Coding)",
+    "alac": "ALAC (Apple Lossless Audio Codec)",
+}
+
+
+def _read_stream_info(audio_file: str) -> dict | None:
+    """
+    Reads the stream information of an audio file from its headers using `mutagen`.
+
+    Only mono and stereo FLAC, MP3, MP4 and PCM WAV files are read, and the result
+    uses the same keys and values as the stream information reported by ffprobe.
+
+    Parameters
+    ----------
+    audio_file : str
+        The path to the audio file.
+
+    Returns
+    -------
+    dict | None
+        The stream information, or None if the file is not supported.
+    """
+    try:
+        audio = mutagen.File(audio_file)
+    except mutagen.MutagenError:
+        return None
+    if audio is None or audio.info.channels not in _CHANNEL_LAYOUTS:
+        return None
+
+    info = audio.info
+    media_info = {
+        "channel_layout": _CHANNEL_LAYOUTS[info.channels],
+        "sample_rate": str(info.sample_rate),
+        "duration": str(info.length),
+        "bit_rate": str(info.bitrate),
+    }
+    if isinstance(audio, FLAC):
+        media_info["codec_long_name"] = "FLAC (Free Lossless Audio Codec)"
+        media_info["bits_per_raw_sample"] = str(info.bits_per_sample)
+        del media_info["bit_rate"]
+    elif isinstance(audio, MP3) and info.layer == 3:
+        media_info["codec_long_name"] = "MP3 (MPEG audio layer 3)"
+    elif isinstance(audio, MP4) and info.codec.split(".")[0] in _MP4_CODECS:
+        media_info["codec_long_name"] = _MP4_CODECS[info.codec.split(".")[0]]
+    elif isinstance(audio, WAVE) and getattr(info, "audio_format", None) == 1:
+        bits = info.bits_per_sample
+        media_info["codec_long_name"] = (
+            "PCM unsigned 8-bit"
+            if bits == 8
+            else f"PCM signed {bits}-bit little-endian"
+        )
+    else:
+        return None
+    return media_info
+
+
+@functools.lru_cache(maxsize=4096)
+def _probe(audio_file: str, mtime: float) -> dict:  # pylint: disable=unused-argument
+    """
+    Reads the stream information of an audio file.
+
+    The stream information is read with `mutagen` when the format is supported,
+    and with FFmpeg's ffprobe command otherwise. The result is cached by path and
+    modification time, so a file is only probed again once it has changed.
+
+    Parameters
+    ----------
+    audio_file : str
+        The path to the audio file.
+    mtime : float
+        The modification time of the audio file, only used as part of the cache key.
+
+    Returns
+    -------
+    dict
+        The parsed JSON output of ffprobe, or an equivalent dictionary.
+    """
+    media_info = _read_stream_info(audio_file)
+    if media_info is not None:
+        return {"streams": [media_info]}
+
+    ffprobe = FFmpeg(executable="ffprobe").input(
+        audio_file,
+        print_format="json",
+        show_streams=None,
+    )
+    return json.loads(ffprobe.execute())
 
 
 class MetadataParser:
@@ -30,20 +132,60 @@ class MetadataParser:
     A class for parsing metadata from audio files.
 
     The MetadataParser class provides methods for retrieving metadata from audio files
-    using FFmpeg's ffprobe command.
+    using `mutagen`, or FFmpeg's ffprobe command for the formats it does not read.
     It can extract metadata such as codec, sample rate, bitrate, duration, and channel layout.
 
     Attributes:
         None
 
     Methods:
+        prefetch(audio_file):
+            Starts retrieving the metadata of an audio file in a background thread.
         get_metadata(audio_file):
-            Retrieves metadata from an audio file using FFmpeg's ffprobe command.
+            Retrieves metadata from an audio file using `mutagen` or ffprobe.
     """
 
+    def __init__(self) -> None:
+        """
+        Initialize the MetadataParser with a single background thread for prefetching.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        self.__pending: dict[tuple[str, float], Future[dict]] = {}
+
+    def prefetch(self, audio_file) -> None:
+        """
+        Starts retrieving the metadata of an audio file in a background thread.
+
+        This lets the metadata be read while the audio file is being processed;
+        a following call to `get_metadata` with the same file waits for this result.
+
+        Parameters
+        ----------
+        audio_file : str
+            The path to the audio file.
+
+        Returns
+        -------
+        None
+        """
+        key = self.__get_cache_key(audio_file)
+        if key not in self.__pending:
+            self.__pending[key] = self.__executor.submit(_probe, *key)
+
     def get_metadata(self, audio_file) -> str:
         """
-        Retrieves metadata from an audio file using FFmpeg's ffprobe command.
+        Retrieves metadata from an audio file using `mutagen` or ffprobe.
+
+        The stream information is read from the file headers with `mutagen` when the
+        format is supported, and with FFmpeg's ffprobe command otherwise.
 
         Parameters
         ----------
@@ -56,15 +198,27 @@ class MetadataParser:
             A string containing needed metadata
 
         """
-        ffprobe = FFmpeg(executable="ffprobe").input(
-            audio_file,
-            print_format="json",
-            show_streams=None,
-        )
-
-        media = json.loads(ffprobe.execute())
+        key = self.__get_cache_key(audio_file)
+        pending = self.__pending.pop(key, None)
+        media = pending.result() if pending is not None else _probe(*key)
         return self.__build_file_metadata__(media)
 
+    def __get_cache_key(self, audio_file) -> tuple[str, float]:
+        """
+        Returns the key identifying the current version of an audio file.
+
+        Parameters
+        ----------
+        audio_file : str
+            The path to the audio file.
+
+        Returns
+        -------
+        tuple[str, float]
+            The path and the modification time of the audio file.
+        """
+        return str(audio_file), os.path.getmtime(audio_file)
+
     def __build_file_metadata__(self, json_file: dict) -> str:
         """
         Builds a string containing the metadata of an audio file.
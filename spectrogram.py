@@ -2,153 +2,654 @@
 # spectrogram.py
 
 This script processes an audio file to generate and display its spectrogram.
-It utilizes the `librosa` library to load the audio file and compute its spectrogram.
-The spectrogram is then converted to decibel units and visualized using `matplotlib`.
+It streams the audio file with `soundfile` (or loads it with `librosa`), and computes
+its spectrogram with a real-input FFT over Hann-windowed frames of the audio data.
+The FFT is done with `pyFFTW` when it is installed, and with `scipy.fft` otherwise, or on
+a CUDA GPU with `PyTorch` when requested.
+The spectrogram is then converted to decibel units and drawn using `matplotlib`.
 The x-axis of the spectrogram is formatted to display time in minutes and seconds.
 """
 
+import os
 import pathlib
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
 import librosa
+import matplotlib
 import numpy as np
-import matplotlib.pyplot as plt
+import soundfile
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
+from PIL import Image
+from scipy import fft
+from scipy.signal.windows import get_window
 from metadata_parser import MetadataParser
 
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import torch
+
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
 
-class Spectrogram:
+class Spectrogram:  # pylint: disable=too-many-instance-attributes
     """
     A class representing a spectrogram of an audio file.
 
     The Spectrogram class provides methods for loading an audio file, computing its spectrogram,
     and saving the spectrogram as a PNG image. The class also provides private helper methods
-    for customizing the spectrogram plot.
+    for customizing the spectrogram plot. The figure is created once and reused for every
+    file, so processing many files with one object only updates its contents.
 
     Attributes:
         audio_file (pathlib.Path): The path to the audio file.
-        audio (np.ndarray): The audio data.
         sampling_rate (int): The sampling rate of the audio data.
-        spectrogram (np.ndarray): The spectrogram of the audio data.
-        db_spectrogram (np.ndarray): The spectrogram in decibel units.
+        duration (float): The duration of the audio data, in seconds.
+        spectrogram (np.ndarray): The float32 magnitude spectrogram of the audio data.
+        db_spectrogram (np.ndarray): The float32 spectrogram in decibel units.
+        n_fft (int): The length of the FFT window, in samples.
+        hop_length (int): The number of samples between successive FFT windows, for
+            a full resolution spectrogram. Long files use a larger hop by default.
+        block_frames (int): The number of frames transformed at once by the STFT.
+        gpu_block_frames (int): The number of frames transformed at once on a GPU.
+        stream_block_size (int): The number of samples read at once from an audio file.
+        fft_workers (int): The number of threads used by each FFT on the CPU, -1 using
+            all CPUs. Defaults to 1, as files are already processed in parallel.
 
     Methods:
+        is_gpu_available(): Checks whether the FFTs can be computed on a CUDA GPU.
         create(audio_file): Loads an audio file and computes its spectrogram.
         save_png(filename): Saves the spectrogram plot as a PNG image.
     """
 
-    def __init__(self) -> None:
+    n_fft: int = 4096
+    hop_length: int = 1024
+    block_frames: int = 256
+    gpu_block_frames: int = 8192
+    stream_block_size: int = 1 << 20
+    fft_workers: int = 1
+    __streamed_formats: tuple[str, ...] = ("WAV", "WAVEX", "FLAC")
+    __windows: dict[int, np.ndarray] = {}
+    __rfft_plans: dict[tuple[tuple[int, ...], int], "pyfftw.FFTW"] = {}
+    __colormap = matplotlib.colormaps["inferno"]
+    __db_range: tuple[float, float] = (-120.0, 0.0)
+    __colors: np.ndarray = __colormap(np.arange(__colormap.N), bytes=True)
+
+    def __init__(self, use_gpu: bool = False) -> None:
         """
         Initialize the Spectrogram object with empty data.
 
         This method initializes the Spectrogram object with empty data. It sets
-        the audio file path to an empty string, and initializes the audio data,
-        sampling rate, spectrogram, and decibel spectrogram as empty numpy arrays.
+        the audio file path to an empty string, the sampling rate and duration to
+        zero, and initializes the spectrogram and decibel spectrogram as empty numpy
+        arrays.
+        It also creates the figure, its image, colorbar, titles and axis labels,
+        which are reused by every call to `save_png`.
 
         Parameters
         ----------
-        None
+        use_gpu : bool, optional
+            Whether to compute the FFTs on a CUDA GPU with `PyTorch`.
+            Defaults to False.
 
         Returns
         -------
         None
         """
         self.audio_file: pathlib.Path = pathlib.Path()
-        self.audio: np.ndarray = np.array([])
         self.sampling_rate: int | float = 0
-        self.spectrogram: np.ndarray = np.array([])
-        self.db_spectrogram: np.ndarray = np.array([])
+        self.duration: float = 0
+        self.spectrogram: np.ndarray = np.array([], dtype=np.float32)
+        self.db_spectrogram: np.ndarray = np.array([], dtype=np.float32)
         self.metadata_parser = MetadataParser()
+        self.__decoder = ThreadPoolExecutor(max_workers=1)
+
+        self.__fft_input: np.ndarray | None = None
+        self.__gpu_window: "torch.Tensor | None" = None
+        if use_gpu:
+            if not self.is_gpu_available():
+                raise RuntimeError("GPU processing requires PyTorch with CUDA support")
+            import torch  # pylint: disable=import-outside-toplevel
+
+            self.__gpu_window = torch.from_numpy(self.__get_window(self.n_fft)).cuda()
+
+        self.__figure = Figure(figsize=(14, 7))
+        self.__canvas = FigureCanvasAgg(self.__figure)
+        self.__axes = self.__figure.add_subplot()
+        self.__image = self.__axes.imshow(
+            np.zeros((1, 1, 4), dtype=np.uint8),
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+        )
+        self.__figure.colorbar(
+            ScalarMappable(Normalize(*self.__db_range), self.__colormap),
+            ax=self.__axes,
+            format="%+2.0f dB",
+        )
+        self.__suptitle = self.__figure.suptitle("")
+        self.__title = self.__axes.set_title("", fontsize=10)
+        self.__axes.set_xlabel("Time (mm:ss)")
+        self.__axes.set_ylabel("Frequency (kHz)")
+        self.__y_axis_sampling_rate: int | float = 0
+
+    @staticmethod
+    def is_gpu_available() -> bool:
+        """
+        Check whether the FFTs can be computed on a CUDA GPU.
+
+        `PyTorch` is only imported here and when a GPU is used, as importing it
+        takes over a second, which would slow down the start of every worker.
 
-    def create(self, audio_file) -> None:
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            True if `PyTorch` is installed and a CUDA device is available.
+        """
+        try:
+            import torch  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return False
+        return torch.cuda.is_available()
+
+    def create(self, audio_file, full_resolution: bool = False) -> None:
         """
         Load an audio file and compute its spectrogram.
 
-        This function sets the audio file path, loads the audio data and its sampling
-        rate using `librosa`, computes the short-time Fourier transform (STFT) of the
-        audio data, and converts the spectrogram to decibel units.
+        This function sets the audio file path, starts fetching its metadata in the
+        background, computes the magnitude of the short-time Fourier transform (STFT)
+        of the audio data, and converts it to decibel units.
+
+        WAV and FLAC files longer than `stream_block_size` samples are streamed with
+        `soundfile` in blocks of that size, each block being transformed as soon as
+        it is decoded, so the whole audio is never held in memory. Other files are
+        loaded whole; MP3 files in particular, as libsndfile does not decode them
+        consistently when they are read in blocks.
+
+        Unless a full resolution spectrogram is requested, the hop between frames
+        is increased for long files, so the spectrogram has about two frames per
+        pixel column of the saved image; more frames would not be visible anyway.
+        The hop never exceeds `n_fft`, so every sample still falls within a frame,
+        and very long files get more frames, which are folded into the pixel
+        columns when the image is drawn.
 
         Parameters
         ----------
         audio_file : str
             The path to the audio file to be processed.
+        full_resolution : bool, optional
+            Whether to always use `hop_length` between frames. Defaults to False.
 
         Returns
         -------
         None
         """
         self.audio_file = audio_file
-        self.audio, self.sampling_rate = librosa.load(str(self.audio_file), sr=None)
+        self.metadata_parser.prefetch(self.audio_file)
+        try:
+            info = soundfile.info(str(self.audio_file))
+        except soundfile.LibsndfileError:
+            info = None
+
+        if (
+            info is not None
+            and info.format in self.__streamed_formats
+            and info.frames > self.stream_block_size
+        ):
+            self.sampling_rate = info.samplerate
+            self.duration = info.frames / info.samplerate
+            hop_length = self.__get_hop_length(info.frames, full_resolution)
+            self.spectrogram = self.__stream_stft(info.frames, hop_length)
+        else:
+            audio, self.sampling_rate = self.__load(info is not None)
+            self.duration = len(audio) / self.sampling_rate
+            hop_length = self.__get_hop_length(len(audio), full_resolution)
+            self.spectrogram = self.__stft(audio, hop_length)
+        self.db_spectrogram = self.__amplitude_to_db(self.spectrogram)
+
+    def __load(self, readable: bool) -> tuple[np.ndarray, int | float]:
+        """
+        Load the whole audio file as mono audio data.
+
+        Files which libsndfile can open are read directly with `soundfile.read`,
+        and other files are loaded with `librosa`, which decodes them with
+        `audioread`. Both give the same `float32` data, but reading with `soundfile`
+        skips the dispatch and copies done by `librosa`.
 
-    def save_png(self) -> None:
+        Parameters
+        ----------
+        readable : bool
+            Whether the audio file can be opened with `soundfile`.
+
+        Returns
+        -------
+        tuple[np.ndarray, int | float]
+            The mono audio data and its sampling rate.
         """
-        Saves the spectrogram plot as a PNG image.
+        if not readable:
+            return librosa.load(str(self.audio_file), sr=None, dtype=np.float32)
+        audio, sampling_rate = soundfile.read(
+            str(self.audio_file), dtype="float32", always_2d=False
+        )
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        return audio, sampling_rate
+
+    def __amplitude_to_db(self, magnitude: np.ndarray) -> np.ndarray:
+        """
+        Convert a magnitude spectrogram to absolute decibel levels.
+
+        The magnitude is divided by the sum of the window, like
+        `matplotlib.mlab.specgram(mode="magnitude")` does, so a full scale sine wave
+        peaks near -6 dB and levels can be compared between files. Magnitudes are
+        floored at -120 dB, the bottom of the colorbar, so silence is drawn with its
+        lowest color. The conversion is computed in place in a single float32
+        output array, instead of going through several full size temporary arrays.
+
+        Parameters
+        ----------
+        magnitude : np.ndarray
+            The magnitude spectrogram.
+
+        Returns
+        -------
+        np.ndarray
+            The spectrogram in decibel units.
+        """
+        amin = np.float32(1e-6)
+        db_spectrogram = magnitude / self.__get_window(self.n_fft).sum()
+        np.maximum(db_spectrogram, amin, out=db_spectrogram)
+        np.log10(db_spectrogram, out=db_spectrogram)
+        db_spectrogram *= np.float32(20)
+        return db_spectrogram
+
+    def __get_hop_length(self, n_samples: int, full_resolution: bool) -> int:
+        """
+        Return the number of samples between successive frames of the spectrogram.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of samples of the audio data.
+        full_resolution : bool
+            Whether to always use `hop_length` between frames.
+
+        Returns
+        -------
+        int
+            `hop_length`, or a larger hop giving about two frames per pixel column
+            of the saved image, whichever is larger, but at most `n_fft`, so the
+            frames cover the whole audio.
+        """
+        if full_resolution:
+            return self.hop_length
+        target_frames = 2 * int(self.__figure.get_figwidth() * self.__figure.dpi)
+        return min(max(self.hop_length, n_samples // target_frames), self.n_fft)
+
+    def __stft(self, audio: np.ndarray, hop_length: int) -> np.ndarray:
+        """
+        Compute the magnitude of the short-time Fourier transform of the audio data.
+
+        Audio shorter than a single frame is zero-padded to `n_fft` samples.
+
+        Parameters
+        ----------
+        audio : np.ndarray
+            The audio data.
+        hop_length : int
+            The number of samples between successive frames.
+
+        Returns
+        -------
+        np.ndarray
+            The magnitude spectrogram, of shape (1 + n_fft // 2, number of frames).
+        """
+        if len(audio) < self.n_fft:
+            audio = np.pad(audio, (0, self.n_fft - len(audio)))
+
+        n_frames = 1 + (len(audio) - self.n_fft) // hop_length
+        magnitude = np.empty((n_frames, 1 + self.n_fft // 2), dtype=np.float32)
+        self.__transform(audio, hop_length, magnitude)
+        return magnitude.T
+
+    def __stream_stft(self, n_samples: int, hop_length: int) -> np.ndarray:
+        """
+        Compute the magnitude of the short-time Fourier transform of the audio file.
+
+        The audio file is read with `soundfile.blocks`, in blocks holding a whole
+        number of hops plus the overlap needed by the last frame of the block, so
+        every frame lies entirely within one block. Each block is read and mixed
+        down to mono on a background thread while the previous one is transformed,
+        so decoding overlaps with the FFTs. Audio shorter than a single frame is
+        zero-padded to `n_fft` samples.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of samples of the audio file.
+        hop_length : int
+            The number of samples between successive frames.
+
+        Returns
+        -------
+        np.ndarray
+            The magnitude spectrogram, of shape (1 + n_fft // 2, number of frames).
+        """
+        n_frames = 1 + (max(n_samples, self.n_fft) - self.n_fft) // hop_length
+        magnitude = np.empty((n_frames, 1 + self.n_fft // 2), dtype=np.float32)
+        overlap = max(self.n_fft - hop_length, 0)
+        block_hops = max(1, self.stream_block_size // hop_length)
+
+        blocks = soundfile.blocks(
+            str(self.audio_file),
+            blocksize=block_hops * hop_length + overlap,
+            overlap=overlap,
+            dtype="float32",
+            always_2d=True,
+        )
+        start = 0
+        pending = self.__decoder.submit(self.__read_block, blocks)
+        try:
+            while (audio := pending.result()) is not None:
+                pending = self.__decoder.submit(self.__read_block, blocks)
+                if len(audio) < self.n_fft:
+                    if start > 0:
+                        continue
+                    audio = np.pad(audio, (0, self.n_fft - len(audio)))
+
+                count = min(
+                    1 + (len(audio) - self.n_fft) // hop_length, n_frames - start
+                )
+                self.__transform(audio, hop_length, magnitude[start : start + count])
+                start += count
+        finally:
+            wait((pending,))
+            blocks.close()
+        return magnitude[:start].T
+
+    @staticmethod
+    def __read_block(blocks: Iterator[np.ndarray]) -> np.ndarray | None:
+        """
+        Read the next block of an audio file and mix it down to mono.
 
         Parameters
         ----------
-        filename : str, optional
-            The filename to save the image as. If not provided, the filename
-            will be the name of the audio file with "_spectrogram" appended to
-            it and ".png" as the file extension.
+        blocks : Iterator[np.ndarray]
+            The blocks of the audio file, as returned by `soundfile.blocks`.
+
+        Returns
+        -------
+        np.ndarray | None
+            The mono audio data of the block, or None if the file has been read.
+        """
+        block = next(blocks, None)
+        if block is None:
+            return None
+        return (
+            block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32)
+        )
+
+    def __transform(self, audio: np.ndarray, hop_length: int, out: np.ndarray) -> None:
+        """
+        Write the magnitude of the STFT of the leading frames of the audio into `out`.
+
+        Frames of `n_fft` samples, `hop_length` samples apart, are taken from the
+        audio data without copying it, as many as `out` has rows. On the CPU they
+        are a strided view, transformed by `__transform_frames`. When a GPU is used,
+        the audio is copied to it once and framed there with `Tensor.unfold`, and
+        the frames are windowed and transformed in blocks of `gpu_block_frames`
+        frames, which bounds the memory used on the device. Only the magnitude of
+        the FFT is copied back, straight into `out`.
+
+        Parameters
+        ----------
+        audio : np.ndarray
+            The audio data, holding at least as many frames as `out` has rows.
+        hop_length : int
+            The number of samples between successive frames.
+        out : np.ndarray
+            The output, of shape (number of frames, 1 + n_fft // 2).
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=(14, 7))
+        if self.__gpu_window is None:
+            frames = np.lib.stride_tricks.sliding_window_view(audio, self.n_fft)
+            self.__transform_frames(frames[::hop_length][: len(out)], out)
+            return
+
+        import torch  # pylint: disable=import-outside-toplevel
+
+        audio_gpu = torch.from_numpy(audio).to(self.__gpu_window.device)
+        frames_gpu = audio_gpu.unfold(0, self.n_fft, hop_length)[: len(out)]
+        out_gpu = torch.from_numpy(out)
+        for start in range(0, len(out), self.gpu_block_frames):
+            block = frames_gpu[start : start + self.gpu_block_frames]
+            magnitude = torch.fft.rfft(block * self.__gpu_window).abs()
+            out_gpu[start : start + len(block)].copy_(magnitude)
+
+    def __transform_frames(self, frames: np.ndarray, out: np.ndarray) -> None:
+        """
+        Write the magnitude of the real-input FFT of Hann-windowed frames into `out`.
+
+        Frames of `n_fft` samples, taken as a strided view of the audio data, are
+        multiplied by a Hann window and transformed with a real-input FFT, which
+        only computes the non-negative frequency bins. The frames are transformed
+        in blocks of `block_frames` frames, so the windowed and transformed
+        intermediates stay a few megabytes large regardless of the number of frames.
+
+        Parameters
+        ----------
+        frames : np.ndarray
+            The frames, of shape (number of frames, n_fft).
+        out : np.ndarray
+            The output, of shape (number of frames, 1 + n_fft // 2).
+
+        Returns
+        -------
+        None
+        """
+        for start in range(0, len(frames), self.block_frames):
+            block = frames[start : start + self.block_frames]
+            np.abs(self.__rfft_block(block), out=out[start : start + len(block)])
+
+    def __rfft_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Compute the real-input FFT of a block of Hann-windowed frames.
+
+        The windowed frames are written into a contiguous, aligned input buffer for
+        blocks of `block_frames` frames: the input buffer of a reusable FFTW plan
+        when `pyFFTW` is installed, and a buffer transformed with `scipy.fft`
+        otherwise, which is only allocated when first needed. A shorter, final
+        block only uses the leading rows of the buffer. Both libraries use
+        `fft_workers` threads.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            The frames, of shape (at most block_frames, n_fft).
+
+        Returns
+        -------
+        np.ndarray
+            The FFT of the windowed frames, of shape (len(block), 1 + n_fft // 2).
+        """
+        window = self.__get_window(self.n_fft)
+        if pyfftw is None:
+            if self.__fft_input is None:
+                self.__fft_input = self.__empty_aligned((self.block_frames, self.n_fft))
+            windowed = self.__fft_input[: len(block)]
+            np.multiply(block, window, out=windowed)
+            return fft.rfft(windowed, axis=-1, workers=self.fft_workers)
+
+        threads = self.fft_workers if self.fft_workers > 0 else os.cpu_count() or 1
+        plan = self.__get_rfft_plan((self.block_frames, self.n_fft), threads)
+        np.multiply(block, window, out=plan.input_array[: len(block)])
+        return plan()[: len(block)]
+
+    @staticmethod
+    def __empty_aligned(shape: tuple[int, ...], alignment: int = 64) -> np.ndarray:
+        """
+        Return an uninitialized float32 array starting on an aligned address.
+
+        A slightly larger buffer is allocated, and the array is the part of it
+        starting at the first address which is a multiple of `alignment` bytes.
 
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            The shape of the array.
+        alignment : int, optional
+            The alignment of the array, in bytes. Defaults to 64.
+
+        Returns
+        -------
+        np.ndarray
+            The aligned array.
+        """
+        itemsize = np.dtype(np.float32).itemsize
+        size = int(np.prod(shape))
+        buffer = np.empty(size + alignment // itemsize, dtype=np.float32)
+        offset = (-buffer.ctypes.data % alignment) // itemsize
+        return buffer[offset : offset + size].reshape(shape)
+
+    @classmethod
+    def __get_rfft_plan(cls, shape: tuple[int, ...], threads: int) -> "pyfftw.FFTW":
+        """
+        Return an FFTW plan computing the real-input FFT of frames of the given shape.
+
+        The plan is measured once and kept on the class, so it is reused for every
+        block of every file while the shape of the blocks stays the same.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            The shape of the blocks, (block_frames, n_fft).
+        threads : int
+            The number of threads used by the plan.
+
+        Returns
+        -------
+        pyfftw.FFTW
+            The FFTW plan.
+        """
+        if (shape, threads) not in cls.__rfft_plans:
+            cls.__rfft_plans[shape, threads] = pyfftw.builders.rfft(
+                pyfftw.empty_aligned(shape, dtype=np.float32),
+                axis=-1,
+                threads=threads,
+                planner_effort="FFTW_MEASURE",
+            )
+        return cls.__rfft_plans[shape, threads]
+
+    @classmethod
+    def __get_window(cls, n_fft: int) -> np.ndarray:
+        """
+        Return the Hann window of the given length, computing it on first use.
+
+        Parameters
+        ----------
+        n_fft : int
+            The length of the window, in samples.
+
+        Returns
+        -------
+        np.ndarray
+            The Hann window.
+        """
+        if n_fft not in cls.__windows:
+            cls.__windows[n_fft] = get_window("hann", n_fft).astype(np.float32)
+        return cls.__windows[n_fft]
+
+    def save_png(self) -> pathlib.Path:
+        """
+        Saves the spectrogram plot as a PNG image.
+
+        The image is saved next to the audio file, with the name of the audio
+        file, its extension and "_spectrogram.png" appended to it. The figure is
+        rendered with Agg and its RGBA buffer is written with `Pillow` at the lowest
+        compression level, which encodes much faster than the default of `savefig`.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pathlib.Path
+            The path to the saved image.
+        """
         self.__set_titles()
         self.__set_x_axis()
         self.__set_y_axis()
         self.__set_graphics()
+        self.__figure.tight_layout(w_pad=0.5)
+        self.__set_image()
 
-        plt.savefig(
-            str(self.audio_file.parent / self.audio_file.stem)
-            + "_"
-            + self.audio_file.suffix[1:]
-            + "_spectrogram.png"
+        output_file = self.audio_file.with_name(
+            self.audio_file.stem + "_" + self.audio_file.suffix[1:] + "_spectrogram.png"
+        )
+        self.__canvas.draw()
+        Image.fromarray(np.asarray(self.__canvas.buffer_rgba())).save(
+            output_file, format="PNG", compress_level=1
         )
-        plt.close()
+        return output_file
 
     def __set_x_axis(self) -> None:
         """
         Set the x-axis for the spectrogram plot.
 
-        This function uses the `plt.xticks` function to set the x-axis tick marks
-        and labels. The tick marks are spaced every 60 seconds, and the labels
-        are formatted as the time in minutes and seconds. The `plt.xlim` function
-        is used to ensure the x-axis extends from 0 seconds to the total duration
-        of the audio file.
+        This function uses the `Axes.set_xticks` function to set the x-axis tick
+        marks and labels. The tick marks are spaced evenly over the duration of the
+        audio file, on whole seconds, and the labels are formatted as the time in
+        minutes and seconds.
         """
-        audio_duration_sec = len(self.audio) / self.sampling_rate
-        ticks = np.linspace(0, audio_duration_sec, num=15).tolist()
-        labels = [f"{int(t/60):02d}:{int(t%60):02d}" for t in ticks]
-        plt.xticks(ticks, labels)
+        ticks = np.linspace(0, self.duration, num=15, dtype=np.int64)
+        minutes, seconds = np.divmod(ticks, 60)
+        labels = [f"{m:02d}:{s:02d}" for m, s in zip(minutes, seconds)]
+        self.__axes.set_xticks(ticks, labels)
 
     def __set_y_axis(self) -> None:
         """
         Set the y-axis for the spectrogram plot.
 
-        This function uses the `plt.yticks` function to set the y-axis tick marks
-        and labels. The tick marks are spaced every 5000 Hz, and the labels are
-        formatted as the frequency value in Hz. The `plt.ylim` function is used
-        to ensure the y-axis extends from 0 Hz to the Nyquist frequency.
+        This function uses the `Axes.set_yticks` function to set the y-axis tick
+        marks and labels. The tick marks are spaced evenly up to the Nyquist
+        frequency, and the labels are formatted as the frequency value in kHz.
+        They are only set again when the sampling rate differs from the one of the
+        previous file.
         """
+        if self.sampling_rate == self.__y_axis_sampling_rate:
+            return
+        self.__y_axis_sampling_rate = self.sampling_rate
         nyquist_frequency = round(self.sampling_rate / 2, -3)
-        ticks = np.linspace(0, nyquist_frequency, num=12).tolist()
-        labels = [f"{t / 1000:.0f}" for t in ticks]
-        plt.yticks(ticks, labels)
+        ticks = np.linspace(0, nyquist_frequency, num=12)
+        self.__axes.set_yticks(ticks, np.char.mod("%.0f", ticks / 1000))
 
     def __set_graphics(self) -> None:
         """
         Set graphics for the spectrogram plot.
 
-        This function sets the graphics for the spectrogram plot, including the
-        colormap, aspect ratio, and extent of the plot. It also adds a colorbar
-        with a format string of "%+2.0f dB" and uses the `plt.tight_layout` function
-        to ensure the plot is correctly sized.
+        This function sets the extent of the image and the axis limits to the
+        duration of the audio file and its Nyquist frequency. It is called after the
+        ticks are set, as setting ticks beyond the limits would extend them. The
+        image data itself is set by `__set_image`, once the layout of the figure is
+        known.
 
         Parameters
         ----------
@@ -158,25 +659,53 @@ class Spectrogram:
         -------
         None
         """
-        plt.specgram(
-            self.audio,
-            Fs=self.sampling_rate,
-            cmap="inferno",
-            vmin=-120,
-            vmax=0,
-            NFFT=4096,
-            mode="magnitude",
-            scale="dB",
-        )
-        plt.colorbar(format="%+2.0f dB")
-        plt.tight_layout(w_pad=0.5)
+        extent = (0, self.duration, 0, self.sampling_rate / 2)
+        self.__image.set_extent(extent)
+        self.__axes.set_xlim(extent[0], extent[1])
+        self.__axes.set_ylim(extent[2], extent[3])
+
+    def __set_image(self) -> None:
+        """
+        Replace the data of the figure's image with the colored decibel spectrogram.
+
+        The decibel spectrogram computed in `create`, so no FFT is done while
+        plotting, is first reduced to at most one value per pixel of the axes, taking
+        the maximum over the frames and frequency bins spanned by each pixel, so
+        every frame contributes and short transients are not dropped.
+        The remaining values are quantized to the 256 colors of the colormap, the
+        same way `matplotlib` normalizes them to the range of the colorbar, and
+        colored through a lookup table of 8-bit RGBA colors. The image is then
+        drawn without any colormapping and with little resampling.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        bbox = self.__axes.get_window_extent()
+        db_spectrogram = self.db_spectrogram
+        for axis, pixels in enumerate((bbox.height, bbox.width)):
+            size = db_spectrogram.shape[axis]
+            pixels = int(np.ceil(pixels))
+            if size > pixels:
+                starts = np.arange(pixels) * size // pixels
+                db_spectrogram = np.maximum.reduceat(db_spectrogram, starts, axis)
+
+        low, high = self.__db_range
+        indices = db_spectrogram - np.float32(low)
+        indices *= np.float32(self.__colormap.N / (high - low))
+        np.clip(indices, 0, self.__colormap.N - 1, out=indices)
+        self.__image.set_data(self.__colors.take(indices.astype(np.uint8), axis=0))
 
     def __set_titles(self) -> None:
         """
         Set titles for the spectrogram plot.
 
-        This function sets the x and y axis labels, the title, and the subtitle
-        of the spectrogram plot.
+        This function sets the text of the title and the subtitle of the
+        spectrogram plot, which are created once in `__init__`.
 
         Parameters
         ----------
@@ -186,11 +715,5 @@ class Spectrogram:
         -------
         None
         """
-
-        plt.xlabel("Time (mm:ss)")
-        plt.ylabel("Frequency (kHz)")
-        plt.suptitle(f"'{self.audio_file.name}' spectrogram")
-        plt.title(
-            self.metadata_parser.get_metadata(self.audio_file),
-            fontsize=10,
-        )
+        self.__suptitle.set_text(f"'{self.audio_file.name}' spectrogram")
+        self.__title.set_text(self.metadata_parser.get_metadata(self.audio_file))